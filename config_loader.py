@@ -0,0 +1,26 @@
+"""
+Niche Researcher - Config Loader
+Shared configuration loading so every module reuses a single parse of config.yaml
+"""
+
+import logging
+import functools
+import yaml
+
+# Prefer the libyaml-backed loader when available
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+logger = logging.getLogger('config_loader')
+
+@functools.lru_cache(maxsize=1)
+def load(path='config.yaml'):
+    """Load and cache the parsed configuration"""
+    try:
+        with open(path, 'rb') as config_file:
+            return yaml.load(config_file, Loader=SafeLoader) or {}
+    except Exception as e:
+        logger.error(f"Error loading configuration: {e}")
+        return {}
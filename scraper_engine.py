@@ -3,14 +3,32 @@ Niche Researcher - Scraper Engine
 Browser automation module for collecting data from various platforms
 """
 
+import os
+import re
 import time
+import asyncio
 import random
 import logging
-import yaml
-import requests
-from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor
+import threading
+import multiprocessing
+import httpx
+import pyarrow as pa
+import pyarrow.parquet as pq
+from cachetools import TTLCache
+from contextlib import contextmanager, ExitStack
+from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urlparse
+from selectolax.lexbor import LexborHTMLParser
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
 from browser_use import Browser
+from config_loader import load as load_config
+
+# Hyperscan is optional; CAPTCHA scanning falls back to a compiled regex without it
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, 
@@ -18,21 +36,18 @@ logging.basicConfig(level=logging.INFO,
 logger = logging.getLogger('scraper_engine')
 
 # Load configuration
-try:
-    with open('config.yaml', 'r') as config_file:
-        config = yaml.safe_load(config_file)
-except Exception as e:
-    logger.error(f"Error loading configuration: {e}")
-    config = {}
+config = load_config()
 
 # Platform-specific CSS selectors
 PLATFORM_SELECTORS = {
     'tiktok': {
+        'container': '[data-e2e="challenge-item-list"]',
         'hashtags': '.hashtag',
         'views': '.video-count',
         'fallback_hashtags': 'a[href*="/tag/"]'
     },
     'amazon': {
+        'container': '#zg-ordered-list',
         'products': '[data-zg-item]',
         'product_name': '.p13n-sc-truncated',
         'price': '.p13n-sc-price',
@@ -40,13 +55,17 @@ PLATFORM_SELECTORS = {
         'fallback_products': '.zg-item'
     },
     'reddit': {
+        'container': '#rcnts',
         'posts': '[data-testid="post-container"]',
         'title': '[data-testid="post-title"]',
         'upvotes': '[data-testid="upvote-count"]',
         'comments': '[data-testid="comment-count"]',
+        'subreddit': 'a[data-click-id="subreddit"]',
+        'permalink': 'a[href*="/comments/"]',
         'fallback_posts': '.Post'
     },
     'youtube': {
+        'container': 'ytd-search #contents',
         'videos': 'ytd-video-renderer,ytd-grid-video-renderer',
         'title': '#video-title',
         'views': '#metadata-line span:first-child',
@@ -55,6 +74,333 @@ PLATFORM_SELECTORS = {
     },
 }
 
+# Worker processes for HTML parsing, so parsing is not bound to one core by the GIL
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+def _get_parse_pool():
+    """Return the parse worker pool, starting it on first use"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            # Forking while scraper threads hold locks can deadlock the workers, so never fork
+            start_methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in start_methods else 'spawn')
+            _parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=context)
+        return _parse_pool
+
+# Default indicators of a CAPTCHA challenge, extended via scraping.captcha_indicators
+CAPTCHA_INDICATORS = [
+    'captcha', 'robot', 'human verification',
+    'security check', 'prove you\'re human'
+]
+
+# Default base URLs used when a platform does not configure one
+DEFAULT_BASE_URLS = {
+    'tiktok': "https://www.tiktok.com/tag/",
+    'amazon': "https://www.amazon.com/best-sellers/",
+    'reddit': "https://www.reddit.com/r/",
+}
+
+# Prefix for YouTube video links built from scraped video IDs
+YOUTUBE_WATCH_URL = "https://www.youtube.com/watch?v="
+
+# Subreddit name in a post permalink such as /r/<name>/comments/<id>/
+REDDIT_PERMALINK_RE = re.compile(r'/r/([^/]+)/comments/')
+
+# Column layout of the data returned for each platform
+PLATFORM_COLUMNS = {
+    'tiktok': ('name', 'views', 'url'),
+    'amazon': ('category', 'name', 'price', 'rating'),
+    'reddit': ('subreddit', 'title', 'upvotes', 'comments'),
+    'youtube': ('query', 'title', 'views', 'date', 'video_id', 'url'),
+}
+
+@lru_cache(maxsize=64)
+def _selector(platform, key):
+    """Return the normalized CSS selector for a platform element"""
+    return ', '.join(part.strip() for part in PLATFORM_SELECTORS[platform][key].split(','))
+
+# Arrow schemas for the Parquet files each platform's results are streamed into
+PLATFORM_SCHEMAS = {
+    platform: pa.schema([(column, pa.string()) for column in columns])
+    for platform, columns in PLATFORM_COLUMNS.items()
+}
+
+def _empty_columns(platform):
+    """Return empty column lists for a platform's scraped data"""
+    return {column: [] for column in PLATFORM_COLUMNS[platform]}
+
+def _scoped_root(tree, platform):
+    """Return the platform's content container, or the whole tree if it is missing"""
+    container = tree.css_first(_selector(platform, 'container'))
+    return container if container is not None else tree
+
+def _parse_tiktok(html_content, base_url):
+    """Extract TikTok hashtag data from a page"""
+    tree = LexborHTMLParser(html_content)
+    root = _scoped_root(tree, 'tiktok')
+    
+    # Try primary selector, fall back to alternative if needed
+    hashtags = root.css(_selector('tiktok', 'hashtags'))
+    if not hashtags:
+        logger.info("Primary selector failed, trying fallback selector")
+        root = tree
+        hashtags = root.css(_selector('tiktok', 'fallback_hashtags'))
+        
+    # Collect view counts once from the node the hashtags came from and pair them by position
+    view_elements = root.css(_selector('tiktok', 'views'))
+        
+    data = _empty_columns('tiktok')
+    view_count = len(view_elements)
+    for index, element in enumerate(hashtags):
+        try:
+            tag_name = element.text().strip()
+            # Some basic cleaning to remove # symbol if present
+            tag_name = tag_name.lstrip('#')
+            
+            view_element = view_elements[index] if index < view_count else None
+            views = view_element.text().strip() if view_element else "N/A"
+            
+            data['name'].append(tag_name)
+            data['views'].append(views)
+            data['url'].append(base_url + tag_name)
+        except Exception as e:
+            logger.warning(f"Error parsing TikTok hashtag: {e}")
+            
+    return data
+
+def _parse_amazon(html_content, category):
+    """Extract Amazon bestseller data from a page"""
+    tree = LexborHTMLParser(html_content)
+    root = _scoped_root(tree, 'amazon')
+    
+    # Try primary selector, fall back to alternative if needed
+    products = root.css(_selector('amazon', 'products'))
+    if not products:
+        logger.info("Primary selector failed, trying fallback selector")
+        products = tree.css(_selector('amazon', 'fallback_products'))
+        
+    # Resolve per-item selectors once rather than on every iteration
+    product_name_selector = _selector('amazon', 'product_name')
+    price_selector = _selector('amazon', 'price')
+    rating_selector = _selector('amazon', 'rating')
+    
+    data = _empty_columns('amazon')
+    for product in products:
+        try:
+            # Get product details
+            name_element = product.css_first(product_name_selector)
+            price_element = product.css_first(price_selector)
+            rating_element = product.css_first(rating_selector)
+            
+            name = name_element.text().strip() if name_element else "N/A"
+            price = price_element.text().strip() if price_element else "N/A"
+            rating = rating_element.text().strip() if rating_element else "N/A"
+            
+            data['category'].append(category)
+            data['name'].append(name)
+            data['price'].append(price)
+            data['rating'].append(rating)
+        except Exception as e:
+            logger.warning(f"Error parsing Amazon product: {e}")
+            
+    return data
+
+def _post_subreddit(post, listing):
+    """Return the subreddit a Reddit post belongs to"""
+    subreddit_element = post.css_first(_selector('reddit', 'subreddit'))
+    if subreddit_element:
+        return subreddit_element.text().strip().removeprefix('r/')
+        
+    permalink_element = post.css_first(_selector('reddit', 'permalink'))
+    match = REDDIT_PERMALINK_RE.search(permalink_element.attributes.get('href') or '') if permalink_element else None
+    if match:
+        return match.group(1)
+        
+    # A combined listing (r/a+b+c) doesn't say which subreddit the post came from
+    return "N/A" if '+' in listing else listing
+
+def _parse_reddit(html_content, subreddit):
+    """Extract Reddit posts data from a page"""
+    tree = LexborHTMLParser(html_content)
+    root = _scoped_root(tree, 'reddit')
+    
+    # Try primary selector, fall back to alternative if needed
+    posts = root.css(_selector('reddit', 'posts'))
+    if not posts:
+        logger.info("Primary selector failed, trying fallback selector")
+        posts = tree.css(_selector('reddit', 'fallback_posts'))
+        
+    title_selector = _selector('reddit', 'title')
+    upvotes_selector = _selector('reddit', 'upvotes')
+    comments_selector = _selector('reddit', 'comments')
+    
+    data = _empty_columns('reddit')
+    for post in posts:
+        try:
+            # Get post details
+            title_element = post.css_first(title_selector)
+            upvotes_element = post.css_first(upvotes_selector)
+            comments_element = post.css_first(comments_selector)
+            
+            title = title_element.text().strip() if title_element else "N/A"
+            upvotes = upvotes_element.text().strip() if upvotes_element else "0"
+            comments = comments_element.text().strip() if comments_element else "0"
+            
+            # Combined listings (r/a+b+c) mix subreddits, so read each post's own subreddit
+            data['subreddit'].append(_post_subreddit(post, subreddit))
+            data['title'].append(title)
+            data['upvotes'].append(upvotes)
+            data['comments'].append(comments)
+        except Exception as e:
+            logger.warning(f"Error parsing Reddit post: {e}")
+            
+    return data
+
+def _parse_youtube(html_content, query):
+    """Extract YouTube search results data from a page"""
+    tree = LexborHTMLParser(html_content)
+    root = _scoped_root(tree, 'youtube')
+    
+    # Try primary selector, fall back to alternative if needed
+    videos = root.css(_selector('youtube', 'videos'))
+    if not videos:
+        logger.info("Primary selector failed, trying fallback selector")
+        videos = tree.css(_selector('youtube', 'fallback_videos'))
+        
+    title_selector = _selector('youtube', 'title')
+    views_selector = _selector('youtube', 'views')
+    date_selector = _selector('youtube', 'date')
+    
+    data = _empty_columns('youtube')
+    for video in videos[:10]:  # Limit to first 10 videos
+        try:
+            # Get video details
+            title_element = video.css_first(title_selector)
+            views_element = video.css_first(views_selector)
+            date_element = video.css_first(date_selector)
+            
+            title = title_element.text().strip() if title_element else "N/A"
+            views = views_element.text().strip() if views_element else "N/A"
+            date = date_element.text().strip() if date_element else "N/A"
+            
+            # Extract video ID from href if available
+            video_id = None
+            href = title_element.attributes.get('href') if title_element else None
+            if href:
+                video_id = href.split('=')[-1]
+            
+            data['query'].append(query)
+            data['title'].append(title)
+            data['views'].append(views)
+            data['date'].append(date)
+            data['video_id'].append(video_id)
+            data['url'].append(YOUTUBE_WATCH_URL + video_id if video_id else "N/A")
+        except Exception as e:
+            logger.warning(f"Error parsing YouTube video: {e}")
+            
+    return data
+
+# Page parsers by platform, run in the worker process pool
+PARSERS = {
+    'tiktok': _parse_tiktok,
+    'amazon': _parse_amazon,
+    'reddit': _parse_reddit,
+    'youtube': _parse_youtube,
+}
+
+class CaptchaDetector:
+    """Scans raw page bytes for any CAPTCHA indicator in a single pass"""
+    
+    def __init__(self, indicators):
+        patterns = [re.escape(indicator.encode()) for indicator in indicators if indicator]
+        self._local = threading.local()
+        if not patterns:
+            # No indicators means no page is treated as a CAPTCHA
+            self._db = None
+            self._regex = None
+        elif hyperscan is not None:
+            self._regex = None
+            self._db = hyperscan.Database()
+            self._db.compile(
+                expressions=patterns,
+                ids=list(range(len(patterns))),
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(patterns)
+            )
+        else:
+            self._db = None
+            self._regex = re.compile(b'|'.join(patterns), re.IGNORECASE)
+            
+    def _scratch(self):
+        """Return this thread's Hyperscan scratch space, which cannot be shared between threads"""
+        scratch = getattr(self._local, 'scratch', None)
+        if scratch is None:
+            scratch = hyperscan.Scratch(self._db)
+            self._local.scratch = scratch
+        return scratch
+        
+    def search(self, html_bytes):
+        """Return True if any indicator occurs in the page"""
+        if self._db is None:
+            return self._regex is not None and self._regex.search(html_bytes) is not None
+            
+        found = []
+        
+        def on_match(match_id, start, end, flags, context):
+            found.append(match_id)
+            return True  # Stop scanning at the first match
+            
+        try:
+            self._db.scan(html_bytes, match_event_handler=on_match, scratch=self._scratch())
+        except hyperscan.ScanTerminated:
+            pass
+        return bool(found)
+
+class ScrapedDataWriter:
+    """Streams scrape results into one Parquet file per platform as they arrive"""
+    
+    def __init__(self, directory):
+        self.directory = directory
+        self.total = 0
+        self._writers = {}
+        # Each run writes its own files rather than overwriting the previous run's
+        self.run_id = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        
+    def path(self, platform):
+        """Return the Parquet file path for a platform in this run"""
+        return os.path.join(self.directory, f"{platform}-{self.run_id}.parquet")
+        
+    def write(self, platform, columns):
+        """Append a platform's column lists to its Parquet file"""
+        schema = PLATFORM_SCHEMAS[platform]
+        batch = pa.RecordBatch.from_pydict(columns, schema=schema)
+        if batch.num_rows == 0:
+            return
+            
+        writer = self._writers.get(platform)
+        if writer is None:
+            os.makedirs(self.directory, exist_ok=True)
+            writer = pq.ParquetWriter(self.path(platform), schema, compression='zstd')
+            self._writers[platform] = writer
+        writer.write_batch(batch)
+        self.total += batch.num_rows
+        
+    def paths(self):
+        """Return the path written for each platform that received data"""
+        return {platform: self.path(platform) for platform in self._writers}
+        
+    def close(self):
+        """Close all files so their Parquet footers are written"""
+        for writer in self._writers.values():
+            writer.close()
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
 class ProxyManager:
     """Manages proxy rotation for web scraping"""
     
@@ -62,20 +408,77 @@ class ProxyManager:
         self.enabled = proxy_config.get('enabled', False)
         self.rotation = proxy_config.get('rotation', False)
         self.proxies = proxy_config.get('providers', [])
-        self.current_index = 0
+        self.max_consecutive_errors = proxy_config.get('max_consecutive_errors', 3)
+        self.cooldown = proxy_config.get('cooldown', 300)
+        self.ewma_alpha = 0.2
+        
+        # Health statistics used to weight the rotation towards fast, reliable proxies
+        self.stats = {
+            proxy.get('url'): {
+                'ewma_ms': 500.0,
+                'error_rate': 0.0,
+                'successes': 0,
+                'consecutive_errors': 0,
+                'disabled_until': 0.0
+            }
+            for proxy in self.proxies
+        }
+        self._lock = threading.Lock()
         
     def get_proxy(self):
-        """Returns the next proxy in the rotation"""
+        """Returns a proxy, favouring those with low latency and few errors"""
         if not self.enabled or not self.proxies:
             return None
             
-        if self.rotation:
-            proxy = self.proxies[self.current_index]
-            self.current_index = (self.current_index + 1) % len(self.proxies)
-        else:
-            proxy = self.proxies[0]
+        if not self.rotation:
+            return self.proxies[0].get('url')
+            
+        with self._lock:
+            now = time.time()
+            available = [url for url, s in self.stats.items() if s['disabled_until'] <= now]
+            if not available:
+                # Every proxy is cooling down, so fall back to the full list rather than stall
+                available = list(self.stats)
+                
+            weights = [
+                1 / (self.stats[url]['ewma_ms'] * (1 + 10 * self.stats[url]['error_rate']))
+                for url in available
+            ]
+            
+        return random.choices(available, weights=weights)[0]
+        
+    def is_disabled(self, url):
+        """Return True if a proxy is cooling down while others are available"""
+        if url not in self.stats:
+            return False
+            
+        with self._lock:
+            now = time.time()
+            if self.stats[url]['disabled_until'] <= now:
+                return False
+            # get_proxy falls back to every proxy when all are cooling down, so none count as disabled
+            return any(s['disabled_until'] <= now for s in self.stats.values())
+        
+    def record(self, url, elapsed, ok):
+        """Update a proxy's health statistics after a request"""
+        if url not in self.stats:
+            return
             
-        return proxy.get('url')
+        with self._lock:
+            s = self.stats[url]
+            # Both averages decay, so a proxy that recovers regains its share of traffic
+            s['error_rate'] = (1 - self.ewma_alpha) * s['error_rate'] + self.ewma_alpha * (0.0 if ok else 1.0)
+            if ok:
+                # Only successful requests update latency; fast connection refusals would look healthy
+                s['ewma_ms'] = (1 - self.ewma_alpha) * s['ewma_ms'] + self.ewma_alpha * elapsed * 1000
+                s['successes'] += 1
+                s['consecutive_errors'] = 0
+            else:
+                s['consecutive_errors'] += 1
+                # Disable the proxy for a while; after the cooldown it is probed again
+                if s['consecutive_errors'] >= self.max_consecutive_errors:
+                    s['disabled_until'] = time.time() + self.cooldown
+                    logger.warning(f"Proxy {url} disabled for {self.cooldown} seconds after repeated errors")
         
 class UserAgentManager:
     """Manages user agent rotation for web scraping"""
@@ -89,6 +492,132 @@ class UserAgentManager:
         """Returns a random user agent from the list"""
         return random.choice(self.user_agents)
 
+class RateLimiter:
+    """Token bucket limiting how often requests are sent to a single host"""
+    
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+        
+    def _reserve(self):
+        """Take a token and return how long the caller must wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+            
+    def acquire(self):
+        """Block until a request may be sent"""
+        wait_time = self._reserve()
+        if wait_time:
+            time.sleep(wait_time)
+            
+    async def acquire_async(self):
+        """Wait without blocking the event loop until a request may be sent"""
+        wait_time = self._reserve()
+        if wait_time:
+            await asyncio.sleep(wait_time)
+
+class BrowserPool:
+    """Keeps a bounded pool of warm browser sessions for reuse across requests"""
+    
+    def __init__(self, size, proxy_manager, user_agent_manager):
+        self.size = max(1, size)
+        self.proxy_manager = proxy_manager
+        self.user_agent_manager = user_agent_manager
+        self._idle = []
+        self._stacks = {}
+        self._proxies = {}
+        self._count = 0
+        # Signalled whenever a browser is returned or a slot is freed
+        self._available = threading.Condition()
+        
+    def _launch(self):
+        """Start a new browser with its own proxy and user agent"""
+        proxy = self.proxy_manager.get_proxy()
+        user_agent = self.user_agent_manager.get_random_user_agent()
+        stack = ExitStack()
+        driver = stack.enter_context(Browser(headless=True, proxy=proxy, user_agent=user_agent))
+        with self._available:
+            self._stacks[id(driver)] = stack
+            self._proxies[id(driver)] = proxy
+        return driver
+        
+    def proxy_for(self, driver):
+        """Return the proxy a pooled browser was launched with"""
+        with self._available:
+            return self._proxies.get(id(driver))
+        
+    def _release_slot(self):
+        """Free a browser slot and wake a caller waiting to launch a replacement"""
+        with self._available:
+            self._count -= 1
+            self._available.notify()
+        
+    def _discard(self, driver):
+        """Shut down a browser and free its slot in the pool"""
+        with self._available:
+            stack = self._stacks.pop(id(driver), None)
+            self._proxies.pop(id(driver), None)
+        self._release_slot()
+        try:
+            stack.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser: {e}")
+        
+    @contextmanager
+    def acquire(self):
+        """Borrow a browser from the pool, launching one if the pool is not yet full"""
+        while True:
+            with self._available:
+                while not self._idle and self._count >= self.size:
+                    self._available.wait()
+                driver = self._idle.pop() if self._idle else None
+                if driver is None:
+                    self._count += 1
+                    break
+                stale = self.proxy_manager.is_disabled(self._proxies.get(id(driver)))
+            if not stale:
+                break
+            # The browser's proxy has been disabled, so replace it rather than keep using it
+            self._discard(driver)
+                
+        if driver is None:
+            try:
+                driver = self._launch()
+            except Exception:
+                self._release_slot()
+                raise
+            
+        try:
+            yield driver
+        except Exception:
+            # Don't hand a browser in an unknown state to the next caller
+            self._discard(driver)
+            raise
+            
+        try:
+            driver.delete_all_cookies()  # Keep sessions isolated between requests
+        except Exception as e:
+            logger.warning(f"Error resetting browser session: {e}")
+            self._discard(driver)
+        else:
+            with self._available:
+                self._idle.append(driver)
+                self._available.notify()
+            
+    def close(self):
+        """Shut down all idle browsers"""
+        with self._available:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+
 class ScraperEngine:
     """Main scraper engine for collecting data from various platforms"""
     
@@ -97,24 +626,88 @@ class ScraperEngine:
         self.max_retries = scraping_config.get('max_retries', 3)
         self.timeout = scraping_config.get('timeout', 30)
         self.delay = scraping_config.get('delay_between_requests', 2)
+        self.max_backoff = scraping_config.get('max_backoff', 60)
+        self.parse_timeout = scraping_config.get('parse_timeout', 120)
         
         self.proxy_manager = ProxyManager(config.get('proxy', {}))
         self.user_agent_manager = UserAgentManager(scraping_config.get('user_agents', []))
+        captcha_indicators = CAPTCHA_INDICATORS + (scraping_config.get('captcha_indicators') or [])
+        self.captcha_detector = CaptchaDetector(list(dict.fromkeys(captcha_indicators)))
+        self.browser_pool = BrowserPool(scraping_config.get('browser_pool_size', 5),
+                                        self.proxy_manager, self.user_agent_manager)
         
         self.platforms_config = config.get('platforms', [])
+        self.data_directory = scraping_config.get('data_directory', 'data')
         
-    def _check_for_captcha(self, html_content):
-        """Check if the response contains a CAPTCHA challenge"""
-        captcha_indicators = [
-            'captcha', 'robot', 'human verification', 
-            'security check', 'prove you\'re human'
-        ]
+        # Bounded TTL caches for fetched pages and parsed results
+        cache_size = scraping_config.get('cache_size', 512)
+        cache_ttl = scraping_config.get('cache_ttl', 600)
+        self._page_cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        self._result_cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        self._cache_lock = threading.Lock()
+        
+        # Per-host token buckets replace fixed sleeps between requests
+        self.requests_per_second = scraping_config.get('requests_per_second', 1)
+        self.burst = scraping_config.get('burst', 2)
+        self._rate_limiters = {}
+        self._rate_limiters_lock = threading.Lock()
+        
+        # Per-host circuit breaker state, shared by all worker threads
+        breaker_config = scraping_config.get('circuit_breaker', {})
+        self.breaker_threshold = breaker_config.get('failure_threshold', 5)
+        self.breaker_window = breaker_config.get('window', 60)
+        self.breaker_cooldown = breaker_config.get('cooldown', 120)
+        self._host_state = {}
+        self._host_state_lock = threading.Lock()
         
-        html_lower = html_content.lower()
-        for indicator in captcha_indicators:
-            if indicator in html_lower:
-                return True
-        return False
+        # Long-lived HTTP/2 clients, one per proxy, so connections are reused across requests
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+        
+    def _client_options(self, proxy):
+        """Return the keyword arguments shared by sync and async HTTP clients"""
+        return {
+            'http2': True,
+            'proxy': proxy,
+            'timeout': self.timeout,
+            'follow_redirects': True,
+            'limits': httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        }
+        
+    def _get_client(self, proxy):
+        """Return the shared HTTP client for a proxy, creating it on first use"""
+        with self._clients_lock:
+            client = self._clients.get(proxy)
+            if client is None:
+                client = httpx.Client(**self._client_options(proxy))
+                self._clients[proxy] = client
+            return client
+            
+    def _get_async_client(self, clients, proxy):
+        """Return the run's async HTTP client for a proxy, creating it on first use"""
+        client = clients.get(proxy)
+        if client is None:
+            client = httpx.AsyncClient(**self._client_options(proxy))
+            clients[proxy] = client
+        return client
+        
+    def close(self):
+        """Close all open HTTP connections and browser sessions"""
+        with self._clients_lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+        self.browser_pool.close()
+            
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        
+    def _check_for_captcha(self, html_bytes):
+        """Check if the raw response body contains a CAPTCHA challenge"""
+        return self.captcha_detector.search(html_bytes)
     
     def _handle_captcha(self, driver):
         """Handle CAPTCHA detection"""
@@ -125,36 +718,123 @@ class ScraperEngine:
         # Return the updated page content after CAPTCHA is solved
         return driver.page_source
         
+    def _get_rate_limiter(self, url):
+        """Return the token bucket for the URL's host"""
+        host = urlparse(url).netloc
+        with self._rate_limiters_lock:
+            limiter = self._rate_limiters.get(host)
+            if limiter is None:
+                limiter = RateLimiter(self.requests_per_second, self.burst)
+                self._rate_limiters[host] = limiter
+            return limiter
+            
+    def _backoff_time(self, attempt):
+        """Return a jittered exponential backoff for a retry attempt"""
+        return min(self.max_backoff, self.delay * (2 ** attempt)) * random.uniform(0.5, 1.5)
+        
+    def _circuit_open(self, url):
+        """Return True if requests to the URL's host are currently short-circuited"""
+        host = urlparse(url).netloc
+        with self._host_state_lock:
+            state = self._host_state.get(host)
+            return state is not None and time.time() < state['open_until']
+            
+    def _is_host_failure(self, error):
+        """Return True if an error suggests the host is unhealthy rather than the URL being bad"""
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            return status >= 500 or status == 429
+        # Transport errors and browser navigation failures
+        return True
+        
+    def _record_host_result(self, url, ok):
+        """Track failures per host and open its circuit when they cluster within the window"""
+        host = urlparse(url).netloc
+        now = time.time()
+        with self._host_state_lock:
+            state = self._host_state.setdefault(host, {'failures': 0, 'window_start': now, 'open_until': 0})
+            if ok:
+                state['failures'] = 0
+                return
+                
+            if now - state['window_start'] > self.breaker_window:
+                state['failures'] = 0
+                state['window_start'] = now
+            state['failures'] += 1
+            
+            if state['failures'] >= self.breaker_threshold:
+                state['open_until'] = now + self.breaker_cooldown
+                state['failures'] = 0
+                logger.warning(f"Circuit opened for {host} for {self.breaker_cooldown} seconds")
+        
+    def _cache_get(self, cache, key):
+        """Return a cached value, or None if it is missing or expired"""
+        with self._cache_lock:
+            return cache.get(key)
+            
+    def _cache_set(self, cache, key, value):
+        """Store a value in one of the engine's caches"""
+        with self._cache_lock:
+            cache[key] = value
+        
     def _make_request_with_retry(self, url, use_browser=True):
+        """Make a request with retry logic, serving recently fetched pages from the cache"""
+        content = self._cache_get(self._page_cache, (url, use_browser))
+        if content is not None:
+            logger.info(f"Using cached page for {url}")
+            return content
+            
+        content = self._request_with_retry(url, use_browser)
+        if content:
+            self._record_host_result(url, True)
+            self._cache_set(self._page_cache, (url, use_browser), content)
+        return content
+        
+    def _request_with_retry(self, url, use_browser=True):
         """Make a request with retry logic"""
+        rate_limiter = self._get_rate_limiter(url)
         for attempt in range(self.max_retries):
+            if self._circuit_open(url):
+                logger.warning(f"Circuit open for {urlparse(url).netloc}, skipping {url}")
+                return None
+            rate_limiter.acquire()
             try:
                 if use_browser:
-                    proxy = self.proxy_manager.get_proxy()
-                    user_agent = self.user_agent_manager.get_random_user_agent()
-                    
-                    with Browser(headless=True, proxy=proxy, user_agent=user_agent) as driver:
-                        driver.goto(url)
+                    with self.browser_pool.acquire() as driver:
+                        proxy = self.browser_pool.proxy_for(driver)
+                        start = time.monotonic()
+                        try:
+                            driver.goto(url)
+                        except Exception:
+                            self.proxy_manager.record(proxy, time.monotonic() - start, False)
+                            raise
+                        self.proxy_manager.record(proxy, time.monotonic() - start, True)
                         driver.wait(2)  # Wait for dynamic content to load
                         
                         # Check for CAPTCHA
-                        if self._check_for_captcha(driver.page_source):
+                        if self._check_for_captcha(driver.page_source.encode()):
                             content = self._handle_captcha(driver)
                         else:
                             content = driver.page_source
                             
                         return content
                 else:
-                    # Use requests for simpler pages
+                    # Use a plain HTTP client for simpler pages
                     headers = {'User-Agent': self.user_agent_manager.get_random_user_agent()}
                     proxy = self.proxy_manager.get_proxy()
-                    proxies = {'http': proxy, 'https': proxy} if proxy else None
                     
-                    response = requests.get(url, headers=headers, proxies=proxies, timeout=self.timeout)
+                    start = time.monotonic()
+                    try:
+                        response = self._get_client(proxy).get(url, headers=headers)
+                    except httpx.TransportError:
+                        self.proxy_manager.record(proxy, time.monotonic() - start, False)
+                        raise
+                    # The proxy delivered a response, so HTTP status errors are the site's, not the proxy's
+                    self.proxy_manager.record(proxy, time.monotonic() - start, True)
                     response.raise_for_status()
                     
                     # Check for CAPTCHA in response content
-                    if self._check_for_captcha(response.text):
+                    if self._check_for_captcha(response.content):
                         logger.warning("CAPTCHA detected in non-browser request. Switching to browser mode.")
                         return self._make_request_with_retry(url, use_browser=True)
                         
@@ -162,203 +842,187 @@ class ScraperEngine:
                     
             except Exception as e:
                 logger.warning(f"Attempt {attempt+1}/{self.max_retries} failed: {e}")
+                if self._is_host_failure(e):
+                    self._record_host_result(url, False)
                 if attempt < self.max_retries - 1:
-                    wait_time = self.delay * (attempt + 1)  # Exponential backoff
-                    logger.info(f"Waiting {wait_time} seconds before retry...")
+                    wait_time = self._backoff_time(attempt)
+                    logger.info(f"Waiting {wait_time:.1f} seconds before retry...")
                     time.sleep(wait_time)
                 else:
                     logger.error(f"Failed to retrieve {url} after {self.max_retries} attempts")
                     return None
     
+    async def _fetch(self, clients, url):
+        """Fetch a page asynchronously, serving recently fetched pages from the cache"""
+        content = self._cache_get(self._page_cache, (url, False))
+        if content is not None:
+            logger.info(f"Using cached page for {url}")
+            return content
+            
+        content = await self._fetch_with_retry(clients, url)
+        if content:
+            self._record_host_result(url, True)
+            self._cache_set(self._page_cache, (url, False), content)
+        return content
+        
+    async def _fetch_with_retry(self, clients, url):
+        """Fetch a page over the run's shared async clients with retry logic"""
+        rate_limiter = self._get_rate_limiter(url)
+        for attempt in range(self.max_retries):
+            if self._circuit_open(url):
+                logger.warning(f"Circuit open for {urlparse(url).netloc}, skipping {url}")
+                return None
+            await rate_limiter.acquire_async()
+            try:
+                headers = {'User-Agent': self.user_agent_manager.get_random_user_agent()}
+                proxy = self.proxy_manager.get_proxy()
+                
+                client = self._get_async_client(clients, proxy)
+                start = time.monotonic()
+                try:
+                    response = await client.get(url, headers=headers)
+                except httpx.TransportError:
+                    self.proxy_manager.record(proxy, time.monotonic() - start, False)
+                    raise
+                # The proxy delivered a response, so HTTP status errors are the site's, not the proxy's
+                self.proxy_manager.record(proxy, time.monotonic() - start, True)
+                response.raise_for_status()
+                # Check for CAPTCHA in response content
+                if self._check_for_captcha(response.content):
+                    logger.warning("CAPTCHA detected in non-browser request. Switching to browser mode.")
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(None, self._make_request_with_retry, url, True)
+                    
+                return response.text
+                
+            except Exception as e:
+                logger.warning(f"Attempt {attempt+1}/{self.max_retries} failed: {e}")
+                if self._is_host_failure(e):
+                    self._record_host_result(url, False)
+                if attempt < self.max_retries - 1:
+                    wait_time = self._backoff_time(attempt)
+                    logger.info(f"Waiting {wait_time:.1f} seconds before retry...")
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.error(f"Failed to retrieve {url} after {self.max_retries} attempts")
+                    return None
+    
+    def _parse_in_pool(self, platform, html_content, param):
+        """Run a platform's page parser in the worker process pool, returning None if it does not finish"""
+        future = _get_parse_pool().submit(PARSERS[platform], html_content, param)
+        try:
+            # The wait includes time spent queued behind other pages, so the limit is generous;
+            # a parse already running in a worker cannot be interrupted, only a queued one dropped
+            return future.result(timeout=self.parse_timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            logger.error(f"No parse result after waiting {self.parse_timeout} seconds")
+            return None
+    
+    async def _parse_in_pool_async(self, platform, html_content, param):
+        """Run a platform's page parser in the worker process pool without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(_get_parse_pool(), PARSERS[platform], html_content, param),
+                timeout=self.parse_timeout
+            )
+        except asyncio.TimeoutError:
+            # wait_for cancels the pool job, which only takes effect if it has not started yet
+            logger.error(f"No parse result after waiting {self.parse_timeout} seconds")
+            return None
+    
+    def _get_base_url(self, platform_name):
+        """Return the configured base URL for a platform"""
+        platform_config = next((p for p in self.platforms_config if p.get('name') == platform_name), {})
+        return platform_config.get('base_url', DEFAULT_BASE_URLS.get(platform_name))
+        
     def scrape_tiktok_hashtags(self, tag="affiliatemarketing"):
         """Scrape TikTok hashtag data"""
-        platform_config = next((p for p in self.platforms_config if p.get('name') == 'tiktok'), {})
-        base_url = platform_config.get('base_url', "https://www.tiktok.com/tag/")
+        cached = self._cache_get(self._result_cache, ('tiktok', tag))
+        if cached is not None:
+            return cached
+            
+        base_url = self._get_base_url('tiktok')
         
         url = f"{base_url}{tag}"
         logger.info(f"Scraping TikTok hashtag: {tag}")
         
         html_content = self._make_request_with_retry(url)
         if not html_content:
-            return []
+            return _empty_columns('tiktok')
             
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Try primary selector, fall back to alternative if needed
-        hashtags = soup.select(PLATFORM_SELECTORS['tiktok']['hashtags'])
-        if not hashtags:
-            logger.info("Primary selector failed, trying fallback selector")
-            hashtags = soup.select(PLATFORM_SELECTORS['tiktok']['fallback_hashtags'])
-            
-        data = []
-        for tag in hashtags:
-            try:
-                tag_name = tag.text.strip()
-                # Some basic cleaning to remove # symbol if present
-                tag_name = tag_name.lstrip('#')
-                
-                # Find view count element near the hashtag if possible
-                view_element = tag.find_next(PLATFORM_SELECTORS['tiktok']['views'])
-                views = view_element.text.strip() if view_element else "N/A"
-                
-                data.append({
-                    'platform': 'tiktok',
-                    'type': 'hashtag',
-                    'name': tag_name,
-                    'views': views,
-                    'url': f"{base_url}{tag_name}"
-                })
-            except Exception as e:
-                logger.warning(f"Error parsing TikTok hashtag: {e}")
-                
+        data = self._parse_in_pool('tiktok', html_content, base_url)
+        if data is None:
+            return _empty_columns('tiktok')
+        self._cache_set(self._result_cache, ('tiktok', tag), data)
         return data
         
     def scrape_amazon_bestsellers(self, category="electronics"):
         """Scrape Amazon bestseller data"""
-        platform_config = next((p for p in self.platforms_config if p.get('name') == 'amazon'), {})
-        base_url = platform_config.get('base_url', "https://www.amazon.com/best-sellers/")
+        cached = self._cache_get(self._result_cache, ('amazon', category))
+        if cached is not None:
+            return cached
+            
+        base_url = self._get_base_url('amazon')
         
         url = f"{base_url}{category}"
         logger.info(f"Scraping Amazon bestsellers for category: {category}")
         
         html_content = self._make_request_with_retry(url)
         if not html_content:
-            return []
-            
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Try primary selector, fall back to alternative if needed
-        products = soup.select(PLATFORM_SELECTORS['amazon']['products'])
-        if not products:
-            logger.info("Primary selector failed, trying fallback selector")
-            products = soup.select(PLATFORM_SELECTORS['amazon']['fallback_products'])
+            return _empty_columns('amazon')
             
-        data = []
-        for product in products:
-            try:
-                # Get product details
-                name_element = product.select_one(PLATFORM_SELECTORS['amazon']['product_name'])
-                price_element = product.select_one(PLATFORM_SELECTORS['amazon']['price'])
-                rating_element = product.select_one(PLATFORM_SELECTORS['amazon']['rating'])
-                
-                name = name_element.text.strip() if name_element else "N/A"
-                price = price_element.text.strip() if price_element else "N/A"
-                rating = rating_element.text.strip() if rating_element else "N/A"
-                
-                data.append({
-                    'platform': 'amazon',
-                    'type': 'product',
-                    'category': category,
-                    'name': name,
-                    'price': price,
-                    'rating': rating
-                })
-            except Exception as e:
-                logger.warning(f"Error parsing Amazon product: {e}")
-                
+        data = self._parse_in_pool('amazon', html_content, category)
+        if data is None:
+            return _empty_columns('amazon')
+        self._cache_set(self._result_cache, ('amazon', category), data)
         return data
         
     def scrape_reddit_posts(self, subreddit="affiliatemarketing"):
         """Scrape Reddit posts data"""
-        platform_config = next((p for p in self.platforms_config if p.get('name') == 'reddit'), {})
-        base_url = platform_config.get('base_url', "https://www.reddit.com/r/")
+        cached = self._cache_get(self._result_cache, ('reddit', subreddit))
+        if cached is not None:
+            return cached
+            
+        base_url = self._get_base_url('reddit')
         
         url = f"{base_url}{subreddit}"
         logger.info(f"Scraping Reddit posts for subreddit: {subreddit}")
         
         html_content = self._make_request_with_retry(url)
         if not html_content:
-            return []
-            
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Try primary selector, fall back to alternative if needed
-        posts = soup.select(PLATFORM_SELECTORS['reddit']['posts'])
-        if not posts:
-            logger.info("Primary selector failed, trying fallback selector")
-            posts = soup.select(PLATFORM_SELECTORS['reddit']['fallback_posts'])
+            return _empty_columns('reddit')
             
-        data = []
-        for post in posts:
-            try:
-                # Get post details
-                title_element = post.select_one(PLATFORM_SELECTORS['reddit']['title'])
-                upvotes_element = post.select_one(PLATFORM_SELECTORS['reddit']['upvotes'])
-                comments_element = post.select_one(PLATFORM_SELECTORS['reddit']['comments'])
-                
-                title = title_element.text.strip() if title_element else "N/A"
-                upvotes = upvotes_element.text.strip() if upvotes_element else "0"
-                comments = comments_element.text.strip() if comments_element else "0"
-                
-                data.append({
-                    'platform': 'reddit',
-                    'type': 'post',
-                    'subreddit': subreddit,
-                    'title': title,
-                    'upvotes': upvotes,
-                    'comments': comments
-                })
-            except Exception as e:
-                logger.warning(f"Error parsing Reddit post: {e}")
-                
+        data = self._parse_in_pool('reddit', html_content, subreddit)
+        if data is None:
+            return _empty_columns('reddit')
+        self._cache_set(self._result_cache, ('reddit', subreddit), data)
         return data
-
+        
     def scrape_youtube_videos(self, query="affiliate marketing"):
         """Scrape YouTube videos data"""
+        cached = self._cache_get(self._result_cache, ('youtube', query))
+        if cached is not None:
+            return cached
+            
         query_formatted = query.replace(' ', '+')
         url = f"https://www.youtube.com/results?search_query={query_formatted}"
         logger.info(f"Scraping YouTube videos for query: {query}")
         
         html_content = self._make_request_with_retry(url)
         if not html_content:
-            return []
+            return _empty_columns('youtube')
             
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Try primary selector, fall back to alternative if needed
-        videos = soup.select(PLATFORM_SELECTORS['youtube']['videos'])
-        if not videos:
-            logger.info("Primary selector failed, trying fallback selector")
-            videos = soup.select(PLATFORM_SELECTORS['youtube']['fallback_videos'])
-            
-        data = []
-        for video in videos[:10]:  # Limit to first 10 videos
-            try:
-                # Get video details
-                title_element = video.select_one(PLATFORM_SELECTORS['youtube']['title'])
-                views_element = video.select_one(PLATFORM_SELECTORS['youtube']['views'])
-                date_element = video.select_one(PLATFORM_SELECTORS['youtube']['date'])
-                
-                title = title_element.text.strip() if title_element else "N/A"
-                views = views_element.text.strip() if views_element else "N/A"
-                date = date_element.text.strip() if date_element else "N/A"
-                
-                # Extract video ID from href if available
-                video_id = None
-                if title_element and title_element.has_attr('href'):
-                    video_id = title_element['href'].split('=')[-1]
-                
-                data.append({
-                    'platform': 'youtube',
-                    'type': 'video',
-                    'query': query,
-                    'title': title,
-                    'views': views,
-                    'date': date,
-                    'video_id': video_id,
-                    'url': f"https://www.youtube.com/watch?v={video_id}" if video_id else "N/A"
-                })
-            except Exception as e:
-                logger.warning(f"Error parsing YouTube video: {e}")
-                
+        data = self._parse_in_pool('youtube', html_content, query)
+        if data is None:
+            return _empty_columns('youtube')
+        self._cache_set(self._result_cache, ('youtube', query), data)
         return data
-
-    def scrape_all_platforms(self, max_workers=5):
-        """Scrape data from all enabled platforms"""
-        all_data = []
-        enabled_platforms = [p for p in self.platforms_config if p.get('enabled', True)]
         
-        # Create scraping tasks based on enabled platforms
+    def _build_scraping_tasks(self):
+        """Create (platform, param) scraping tasks based on enabled platforms"""
+        enabled_platforms = [p for p in self.platforms_config if p.get('enabled', True)]
         scraping_tasks = []
         
         for platform in enabled_platforms:
@@ -375,18 +1039,26 @@ class ScraperEngine:
                     scraping_tasks.append(('amazon', category))
                     
             elif platform_name == 'reddit':
+                # Reddit serves several subreddits from one combined listing (r/a+b+c)
                 subreddits = platform.get('subreddits', ["affiliatemarketing"])
-                for subreddit in subreddits:
-                    scraping_tasks.append(('reddit', subreddit))
+                if subreddits:
+                    scraping_tasks.append(('reddit', '+'.join(subreddits)))
                     
             elif platform_name == 'youtube':
                 queries = platform.get('search_queries', ["affiliate marketing"])
                 for query in queries:
                     scraping_tasks.append(('youtube', query))
+                    
+        return scraping_tasks
+
+    def scrape_all_platforms(self, max_workers=5):
+        """Scrape data from all enabled platforms, streaming results into per-platform Parquet files"""
+        scraping_tasks = self._build_scraping_tasks()
         
-        # Rate limiting - only process a few tasks at a time
-        with ThreadPoolExecutor(max_workers=min(max_workers, len(scraping_tasks))) as executor:
-            futures = []
+        # Requests are paced per host by the rate limiters, so tasks are submitted immediately
+        with ScrapedDataWriter(self.data_directory) as writer, \
+                ThreadPoolExecutor(max_workers=min(max_workers, len(scraping_tasks))) as executor:
+            futures = {}
             
             for platform, param in scraping_tasks:
                 if platform == 'tiktok':
@@ -400,20 +1072,133 @@ class ScraperEngine:
                 else:
                     continue
                     
-                futures.append(future)
-                
-                # Add delay between task submissions to avoid rate limiting
-                time.sleep(1)
+                futures[future] = platform
             
-            # Collect results
-            for future in futures:
+            # Write results in completion order so a slow task doesn't hold back finished ones
+            for future in as_completed(futures):
                 try:
-                    result = future.result()
-                    all_data.extend(result)
+                    writer.write(futures[future], future.result())
                 except Exception as e:
                     logger.error(f"Error in scraping task: {e}")
         
-        logger.info(f"Completed scraping {len(all_data)} items from {len(scraping_tasks)} sources")
+        all_data = writer.paths()
+        logger.info(f"Completed scraping {writer.total} items from {len(scraping_tasks)} sources")
+        return all_data
+
+    async def scrape_tiktok_async(self, clients, tag="affiliatemarketing"):
+        """Scrape TikTok hashtag data without a browser"""
+        cached = self._cache_get(self._result_cache, ('tiktok', tag))
+        if cached is not None:
+            return cached
+            
+        base_url = self._get_base_url('tiktok')
+        logger.info(f"Scraping TikTok hashtag: {tag}")
+        
+        html_content = await self._fetch(clients, f"{base_url}{tag}")
+        if not html_content:
+            return _empty_columns('tiktok')
+            
+        data = await self._parse_in_pool_async('tiktok', html_content, base_url)
+        if data is None:
+            return _empty_columns('tiktok')
+        self._cache_set(self._result_cache, ('tiktok', tag), data)
+        return data
+        
+    async def scrape_amazon_async(self, clients, category="electronics"):
+        """Scrape Amazon bestseller data without a browser"""
+        cached = self._cache_get(self._result_cache, ('amazon', category))
+        if cached is not None:
+            return cached
+            
+        base_url = self._get_base_url('amazon')
+        logger.info(f"Scraping Amazon bestsellers for category: {category}")
+        
+        html_content = await self._fetch(clients, f"{base_url}{category}")
+        if not html_content:
+            return _empty_columns('amazon')
+            
+        data = await self._parse_in_pool_async('amazon', html_content, category)
+        if data is None:
+            return _empty_columns('amazon')
+        self._cache_set(self._result_cache, ('amazon', category), data)
+        return data
+        
+    async def scrape_reddit_async(self, clients, subreddit="affiliatemarketing"):
+        """Scrape Reddit posts data without a browser"""
+        cached = self._cache_get(self._result_cache, ('reddit', subreddit))
+        if cached is not None:
+            return cached
+            
+        base_url = self._get_base_url('reddit')
+        logger.info(f"Scraping Reddit posts for subreddit: {subreddit}")
+        
+        html_content = await self._fetch(clients, f"{base_url}{subreddit}")
+        if not html_content:
+            return _empty_columns('reddit')
+            
+        data = await self._parse_in_pool_async('reddit', html_content, subreddit)
+        if data is None:
+            return _empty_columns('reddit')
+        self._cache_set(self._result_cache, ('reddit', subreddit), data)
+        return data
+        
+    async def scrape_youtube_async(self, clients, query="affiliate marketing"):
+        """Scrape YouTube videos data without a browser"""
+        cached = self._cache_get(self._result_cache, ('youtube', query))
+        if cached is not None:
+            return cached
+            
+        query_formatted = query.replace(' ', '+')
+        logger.info(f"Scraping YouTube videos for query: {query}")
+        
+        html_content = await self._fetch(clients, f"https://www.youtube.com/results?search_query={query_formatted}")
+        if not html_content:
+            return _empty_columns('youtube')
+            
+        data = await self._parse_in_pool_async('youtube', html_content, query)
+        if data is None:
+            return _empty_columns('youtube')
+        self._cache_set(self._result_cache, ('youtube', query), data)
+        return data
+
+    async def scrape_all_platforms_async(self, max_workers=5):
+        """Scrape data from all enabled platforms concurrently, streaming results into Parquet files"""
+        scrapers = {
+            'tiktok': self.scrape_tiktok_async,
+            'amazon': self.scrape_amazon_async,
+            'reddit': self.scrape_reddit_async,
+            'youtube': self.scrape_youtube_async,
+        }
+        scraping_tasks = [task for task in self._build_scraping_tasks() if task[0] in scrapers]
+        
+        # Limit the number of requests in flight at once
+        semaphore = asyncio.Semaphore(max_workers)
+        
+        async def run_task(platform, clients, param):
+            async with semaphore:
+                result = await scrapers[platform](clients, param)
+            # Write as soon as each task finishes rather than after the whole run
+            writer.write(platform, result)
+        
+        # Async clients are bound to this run's event loop, so they are created per run
+        clients = {}
+        with ScrapedDataWriter(self.data_directory) as writer:
+            try:
+                results = await asyncio.gather(
+                    *(run_task(platform, clients, param)
+                      for platform, param in scraping_tasks),
+                    return_exceptions=True
+                )
+            finally:
+                for client in clients.values():
+                    await client.aclose()
+        
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error in scraping task: {result}")
+        
+        all_data = writer.paths()
+        logger.info(f"Completed scraping {writer.total} items from {len(scraping_tasks)} sources")
         return all_data
 
 # If run directly, test the scraper
@@ -423,19 +1208,26 @@ if __name__ == "__main__":
     # Test scraping TikTok
     print("Testing TikTok scraping...")
     tiktok_data = scraper.scrape_tiktok_hashtags()
-    print(f"Found {len(tiktok_data)} TikTok hashtags")
+    print(f"Found {len(tiktok_data['name'])} TikTok hashtags")
     
     # Test scraping Amazon
     print("Testing Amazon scraping...")
     amazon_data = scraper.scrape_amazon_bestsellers()
-    print(f"Found {len(amazon_data)} Amazon products")
+    print(f"Found {len(amazon_data['name'])} Amazon products")
     
     # Test scraping Reddit
     print("Testing Reddit scraping...")
     reddit_data = scraper.scrape_reddit_posts()
-    print(f"Found {len(reddit_data)} Reddit posts")
+    print(f"Found {len(reddit_data['title'])} Reddit posts")
     
     # Test scraping all platforms
     print("Testing multi-platform scraping...")
     all_data = scraper.scrape_all_platforms(max_workers=2)
-    print(f"Found {len(all_data)} total items")
\ No newline at end of file
+    print(f"Wrote scraped data to {', '.join(all_data.values())}")
+    
+    # Test scraping all platforms over a single event loop
+    print("Testing async multi-platform scraping...")
+    async_data = asyncio.run(scraper.scrape_all_platforms_async(max_workers=5))
+    print(f"Wrote scraped data to {', '.join(async_data.values())}")
+    
+    scraper.close()
\ No newline at end of file
@@ -4,15 +4,19 @@ Data processing logic for analyzing market trends and niche opportunities
 """
 
 import os
-import yaml
+import time
+import random
 import logging
 import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
 from datetime import datetime, timedelta
 from pytrends.request import TrendReq
 import importlib
 import importlib.util
 from pathlib import Path
+from collections import defaultdict
+from config_loader import load as load_config
 
 # Setup logging
 logging.basicConfig(level=logging.INFO,
@@ -20,15 +24,10 @@ logging.basicConfig(level=logging.INFO,
 logger = logging.getLogger('trend_analyzer')
 
 # Load configuration
-try:
-    with open('config.yaml', 'r') as config_file:
-        config = yaml.safe_load(config_file)
-except Exception as e:
-    logger.error(f"Error loading configuration: {e}")
-    config = {}
+config = load_config()
 
 # Default affiliate program database
-AFFILIATE_DB = {
+_RAW_AFFILIATE_DB = {
     'AI Tools': ['Jasper', 'Copy.ai', 'WriteSonic', 'Notion AI'],
     'Fitness': ['Bodybuilding.com', 'MyProtein', 'Gymshark', 'Rogue Fitness'],
     'Home Automation': ['Amazon Associates', 'SmartThings', 'Philips Hue', 'Nest'],
@@ -56,6 +55,18 @@ AFFILIATE_DB = {
     'Smart Fitness': ['Peloton', 'Mirror', 'Echelon', 'NordicTrack']
 }
 
+def _build_program_index(affiliate_db):
+    """Invert a niche -> programs mapping into program -> niches"""
+    index = defaultdict(set)
+    for niche, programs in affiliate_db.items():
+        for program in programs:
+            index[program].add(niche)
+    return {program: frozenset(niches) for program, niches in index.items()}
+
+# Frozensets give O(1) membership tests, plus a reverse index for program lookups
+AFFILIATE_DB = {niche: frozenset(programs) for niche, programs in _RAW_AFFILIATE_DB.items()}
+PROGRAM_TO_NICHES = _build_program_index(AFFILIATE_DB)
+
 # Content strategy templates
 CONTENT_STRATEGY_TEMPLATES = {
     'TikTok': [
@@ -95,23 +106,40 @@ CONTENT_STRATEGY_TEMPLATES = {
     ]
 }
 
+# Google Trends accepts at most this many keywords per payload
+PYTRENDS_BATCH_SIZE = 5
+
+def _chunked(items, n=PYTRENDS_BATCH_SIZE):
+    """Split a sequence into consecutive lists of at most n items"""
+    items = list(items)
+    return [items[i:i + n] for i in range(0, len(items), n)]
+
 class TrendAnalyzer:
     """Analyzes market trends and identifies niche opportunities"""
     
+    # Loaded plugin modules shared by all analyzers, keyed by path and stored with the file's mtime
+    _PLUGIN_CACHE = {}
+    
     def __init__(self, scraped_data=None):
         self.trend_config = config.get('trend_analysis', {})
         self.growth_weight = self.trend_config.get('growth_weight', 0.7)
         self.competition_weight = self.trend_config.get('competition_weight', 0.3)
         self.min_growth_percentage = self.trend_config.get('min_growth_percentage', 15)
+        self.max_growth_percentage = self.trend_config.get('max_growth_percentage', 1000)
         self.date_range = self.trend_config.get('date_range', '6mo')
         
         self.affiliate_db = AFFILIATE_DB.copy()
-        self.scraped_data = scraped_data or []
+        self.scraped_data = scraped_data or {}
         self.trend_data = None
         self.niche_scores = None
         
+        # Google Trends session, created on first use and reused across fetches
+        self._pytrends = None
+        
         # Load custom plugins if available
         self._load_plugins()
+        self.program_to_niches = (PROGRAM_TO_NICHES if self.affiliate_db == AFFILIATE_DB
+                                  else _build_program_index(self.affiliate_db))
         
     def _load_plugins(self):
         """Load custom plugins for affiliate networks and scoring algorithms"""
@@ -132,18 +160,43 @@ class TrendAnalyzer:
                 try:
                     # Attempt to load the plugin
                     plugin_path = os.path.join(plugin_dir, f"{plugin_name}.py")
-                    if os.path.exists(plugin_path):
-                        spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
-                        plugin_module = importlib.util.module_from_spec(spec)
-                        spec.loader.exec_module(plugin_module)
-                        
+                    plugin_module = self._get_plugin_module(plugin_name, plugin_path)
+                    if plugin_module is not None:
                         # Add affiliate programs from plugin
                         if hasattr(plugin_module, 'AFFILIATE_PROGRAMS'):
-                            self.affiliate_db.update(plugin_module.AFFILIATE_PROGRAMS)
+                            self.affiliate_db.update({
+                                niche: frozenset(programs)
+                                for niche, programs in plugin_module.AFFILIATE_PROGRAMS.items()
+                            })
                             logger.info(f"Loaded affiliate programs from {plugin_name}")
                 except Exception as e:
                     logger.error(f"Error loading affiliate network plugin {plugin_name}: {e}")
     
+    def _get_plugin_module(self, plugin_name, plugin_path):
+        """Return the plugin module, executing it only if it is new or changed on disk"""
+        try:
+            mtime = os.path.getmtime(plugin_path)
+        except OSError:
+            return None
+            
+        cached = self._PLUGIN_CACHE.get(plugin_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+            
+        spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
+        plugin_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(plugin_module)
+        self._PLUGIN_CACHE[plugin_path] = (mtime, plugin_module)
+        return plugin_module
+        
+    def load_scraped_data(self, parquet_paths, columns=None):
+        """Load the per-platform Parquet files written by the scraper engine"""
+        self.scraped_data = {
+            platform: pq.read_table(path, columns=columns).to_pandas()
+            for platform, path in parquet_paths.items()
+        }
+        return self.scraped_data
+        
     def fetch_google_trends(self, keywords, timeframe='6-m'):
         """Fetch trend data from Google Trends"""
         logger.info(f"Fetching Google Trends data for {len(keywords)} keywords")
@@ -158,7 +211,90 @@ class TrendAnalyzer:
         else:
             timeframe = 'today 6-m'  # Default to 6 months
             
-        try:
-            pytrends = TrendReq(timeout=config.get('apis', {}).get('pytrends', {}).get('timeout', 60))
+        if self._pytrends is None:
+            try:
+                self._pytrends = TrendReq(
+                    hl='en-US',
+                    tz=0,
+                    timeout=config.get('apis', {}).get('pytrends', {}).get('timeout', 60)
+                )
+            except Exception as e:
+                logger.error(f"Error fetching Google Trends data: {e}")
+                return pd.DataFrame()
+        pytrends = self._pytrends
+            
+        # Google scales each payload to its own peak, so every group carries the first keyword
+        # as a shared anchor and is rescaled to it below
+        keywords = list(dict.fromkeys(keywords))
+        if not keywords:
+            return pd.DataFrame()
+        anchor = keywords[0]
+        groups = [[anchor] + group for group in _chunked(keywords[1:], PYTRENDS_BATCH_SIZE - 1)] or [[anchor]]
+        
+        # Request keywords in groups of five over the shared session
+        frames = []
+        for index, group in enumerate(groups):
+            try:
+                pytrends.build_payload(group, timeframe=timeframe)
+                group_data = pytrends.interest_over_time()
+                
+                # Drop the partial-period flag so only keyword series remain
+                if 'isPartial' in group_data.columns:
+                    group_data = group_data.drop(columns=['isPartial'])
+                    
+                frames.append(group_data)
+            except Exception as e:
+                logger.error(f"Error fetching Google Trends data for {group}: {e}")
+                
+            # Jittered pause between groups to stay under the rate limit
+            if index < len(groups) - 1:
+                time.sleep(random.uniform(1, 3))
+                
+        if not frames:
+            return pd.DataFrame()
+            
+        # Bring every group onto the first group's scale using the anchor's total interest
+        reference = frames[0][anchor].sum()
+        for index in range(1, len(frames)):
+            anchor_total = frames[index][anchor].sum()
+            if reference > 0 and anchor_total > 0:
+                frames[index] = frames[index] * (reference / anchor_total)
+            else:
+                logger.warning(f"Anchor keyword '{anchor}' has no interest; group {index} left unscaled")
+            frames[index] = frames[index].drop(columns=[anchor])
+            
+        trend_data = pd.concat(frames, axis=1)
+        self.trend_data = trend_data
+        return trend_data
             
-            #
\ No newline at end of file
+    def calculate_niche_scores(self, competition=None):
+        """Score every keyword in the trend data in a single vectorized pass"""
+        if self.trend_data is None or self.trend_data.empty:
+            logger.warning("No trend data available for scoring")
+            return pd.DataFrame()
+            
+        # Keywords x time matrix of Google Trends interest values
+        values = self.trend_data.to_numpy(dtype=np.float64).T
+        window = max(1, values.shape[1] // 6)
+        start = values[:, :window].mean(axis=1)
+        end = values[:, -window:].mean(axis=1)
+        
+        # Growth between the first and last window, capped so breakouts from zero interest rank first
+        growth_pct = np.divide((end - start) * 100, start, out=np.zeros_like(end), where=start > 0)
+        growth_pct[(start == 0) & (end > 0)] = self.max_growth_percentage
+        growth_pct = np.minimum(growth_pct, self.max_growth_percentage)
+        
+        # Average interest is used as the market saturation estimate unless one is supplied
+        df = pd.DataFrame({
+            'growth_pct': growth_pct,
+            'competition': values.mean(axis=1)
+        }, index=self.trend_data.columns)
+        if competition is not None:
+            df['competition'] = pd.Series(competition, dtype=np.float64).reindex(df.index).fillna(df['competition'])
+            
+        weights = np.array([self.growth_weight, -self.competition_weight])
+        df['score'] = df[['growth_pct', 'competition']].to_numpy() @ weights
+        
+        df = df[df.growth_pct >= self.min_growth_percentage].sort_values('score', ascending=False)
+        self.niche_scores = df
+        return df